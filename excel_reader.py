@@ -1,98 +1,195 @@
 """
-ExcelReader class for efficient Excel file reading using pandas DataFrame.
-Loads Excel file once into DataFrame and provides methods to read cells efficiently.
+ExcelReader class for efficient Excel file reading.
+Loads Excel file once into a NumPy array and provides methods to read cells efficiently.
+The sheet is also available as a pandas DataFrame on request.
 """
 
-import re
-from typing import Any, Optional, List, Dict
+from typing import Any, Optional, List, Dict, Tuple
+import numpy as np
 import pandas as pd
-from utils import get_local_path, is_blank_or_na, cleanup_temp_file
+from utils import (
+    BLANK_VALUES, get_local_path, is_blank_or_na, cleanup_temp_file, default_engine,
+    load_sheet, ColumnCell, RowCell, parse_cell_address, column_index_to_letter
+)
 
 
-def _parse_cell_address(cell_address: str) -> tuple[int, int]:
+def _blank_string_mask(values: np.ndarray) -> np.ndarray:
     """
-    Parse Excel cell address (e.g., 'A1', 'B5') to (row, col) indices.
+    Find the strings that is_blank_or_na treats as blank (e.g., 'N/A', '  ').
     
     Args:
-        cell_address: Excel cell address like 'A1', 'B5', 'AA10'
+        values: 1-D object array of cell values
     
     Returns:
-        Tuple of (row_index, column_index) where both are 0-based
+        Boolean array, True where the value is a blank/null/N/A string
+    """
+    series = pd.Series(values, dtype=object)
+    try:
+        normalized = series.str.strip().str.upper()
+    except AttributeError:
+        # The .str accessor refuses columns that hold no strings at all
+        return np.zeros(len(values), dtype=bool)
+    return normalized.isin(BLANK_VALUES).to_numpy(dtype=bool)
+
+
+def _find_first_empty(empty: np.ndarray, start: int = 0) -> int:
+    """
+    Find the first empty cell at or after start.
     
-    Raises:
-        ValueError: If cell address format is invalid
+    Args:
+        empty: 1-D boolean array, True where the cell is empty
+        start: Position to start searching from
+    
+    Returns:
+        Position of the first empty cell, or len(empty) if there is none
+    """
+    tail = empty[start:]
+    if not len(tail):
+        return len(empty)
+    # argmax stops at the first True; it is 0 for an all-False tail as well
+    position = int(np.argmax(tail))
+    return start + position if tail[position] else len(empty)
+
+
+def _parse_column_range(usecols: str) -> Tuple[int, int]:
     """
-    match = re.match(r'^([A-Z]+)(\d+)$', cell_address.upper())
-    if not match:
-        raise ValueError(f"Invalid cell address format: {cell_address}")
+    Parse an Excel column range (e.g., 'B:D', or 'C' for one column).
+    
+    Args:
+        usecols: Column letters, optionally as 'first:last'
     
-    col_str = match.group(1)
-    row_str = match.group(2)
+    Returns:
+        Tuple of (first_column_index, last_column_index), both 0-based
     
-    # Convert column letters to number (A=0, B=1, ..., Z=25, AA=26, etc.)
-    col_num = 0
-    for char in col_str:
-        col_num = col_num * 26 + (ord(char) - ord('A') + 1)
-    col_num -= 1  # Make it 0-based
+    Raises:
+        ValueError: If the column range is invalid
+    """
+    first, _, last = usecols.partition(':')
+    first_idx = parse_cell_address(f"{first}1")[1]
+    last_idx = parse_cell_address(f"{last or first}1")[1]
     
-    # Convert row string to number (1-based to 0-based)
-    row_num = int(row_str) - 1
+    if first_idx > last_idx:
+        raise ValueError(
+            f"Invalid column range: {usecols}. First column must not be after last."
+        )
     
-    return row_num, col_num
+    return first_idx, last_idx
 
 
 class ExcelReader:
     """
-    Efficient Excel file reader that loads file once into DataFrame.
+    Efficient Excel file reader that loads file once into memory.
     Supports both local files and S3 URIs.
     """
     
-    def __init__(self, excel_path: str, sheet_name: Optional[str] = None):
+    def __init__(self, excel_path: str, sheet_name: Optional[str] = None,
+                 engine: Optional[str] = None, nrows: Optional[int] = None,
+                 usecols: Optional[str] = None):
         """
-        Initialize ExcelReader and load Excel file into DataFrame.
+        Initialize ExcelReader and load the Excel sheet into memory.
         
         Args:
             excel_path: Path to Excel file (local path or S3 URI)
             sheet_name: Optional sheet name. If None, loads first sheet.
+            engine: Optional parsing engine ('calamine' or 'openpyxl').
+                If None, uses calamine when installed, openpyxl otherwise.
+            nrows: Optional number of rows to load, starting from row 1.
+                If None, loads all rows.
+            usecols: Optional Excel column range to load (e.g., 'B:D', or 'C'
+                for one column). If None, loads all columns.
+        
+        Cells outside the loaded rows/columns read as empty, and cell
+        addresses always refer to the full sheet.
         
         Raises:
             FileNotFoundError: If file not found
-            ValueError: If sheet name not found
+            ImportError: If engine is 'calamine' and python-calamine is not installed
+            ValueError: If sheet name or column range is invalid
         """
         self.excel_path = excel_path
         self.local_path = None
         self.is_temp = False
         self.sheet_name = sheet_name
-        self.dataframe: Optional[pd.DataFrame] = None
-        self._load_dataframe()
+        self.engine = engine or default_engine()
+        self.nrows = nrows
+        self.usecols = usecols
+        self._dataframe: Optional[pd.DataFrame] = None
+        self._values: Optional[np.ndarray] = None
+        self._values_by_column: Optional[np.ndarray] = None
+        self._empty: Optional[np.ndarray] = None
+        self._nrows = 0
+        self._ncols = 0
+        self._first_col = 0  # Sheet column index of the first loaded column
+        self._load_sheet()
     
-    def _load_dataframe(self) -> None:
-        """Load Excel file into pandas DataFrame."""
+    @classmethod
+    def bounded_load(cls, excel_path: str, cell_range: str,
+                     sheet_name: Optional[str] = None,
+                     engine: Optional[str] = None) -> 'ExcelReader':
+        """
+        Create an ExcelReader that only loads the part of the sheet needed
+        to serve reads inside cell_range.
+        
+        Args:
+            excel_path: Path to Excel file (local path or S3 URI)
+            cell_range: Range the caller will read from (e.g., 'B2:D100')
+            sheet_name: Optional sheet name. If None, loads first sheet.
+            engine: Optional parsing engine ('calamine' or 'openpyxl')
+        
+        Returns:
+            ExcelReader with rows 1..last row of the range and the range's
+            columns loaded
+        
+        Example:
+            with ExcelReader.bounded_load('sample_data.xlsx', 'B2:C100') as reader:
+                values = reader.read_cell_range('B2', 'C10')
+        """
+        start_cell, _, end_cell = cell_range.partition(':')
+        end_row, end_col = parse_cell_address(end_cell or start_cell)
+        start_col = parse_cell_address(start_cell)[1]
+        
+        return cls(
+            excel_path,
+            sheet_name=sheet_name,
+            engine=engine,
+            nrows=end_row + 1,
+            usecols=(
+                f"{column_index_to_letter(start_col)}:"
+                f"{column_index_to_letter(end_col)}"
+            )
+        )
+    
+    def _load_sheet(self) -> None:
+        """Load the Excel sheet into a NumPy object array."""
         self.local_path, self.is_temp = get_local_path(self.excel_path)
         
         try:
-            # Read all sheets to get sheet names
-            excel_file = pd.ExcelFile(self.local_path)
-            
-            if self.sheet_name:
-                if self.sheet_name not in excel_file.sheet_names:
-                    available = excel_file.sheet_names
-                    raise ValueError(
-                        f"Sheet '{self.sheet_name}' not found. "
-                        f"Available sheets: {available}"
-                    )
-                sheet_to_load = self.sheet_name
-            else:
-                sheet_to_load = excel_file.sheet_names[0]
-                self.sheet_name = sheet_to_load
+            col_range = _parse_column_range(self.usecols) if self.usecols else None
             
-            # Load the sheet into DataFrame
-            self.dataframe = pd.read_excel(
+            # Read straight from calamine/openpyxl; pandas' dtype inference and
+            # block construction are pure overhead for scalar cell reads
+            self.sheet_name, rows = load_sheet(
                 self.local_path,
-                sheet_name=sheet_to_load,
-                header=None,
-                engine='openpyxl'
+                self.sheet_name,
+                engine=self.engine,
+                nrows=self.nrows,
+                col_range=col_range
             )
+            
+            # One row-major object array for all read paths; empty cells
+            # are None straight from the parser
+            self._nrows = len(rows)
+            self._ncols = max(map(len, rows), default=0)
+            self._values = np.empty((self._nrows, self._ncols), dtype=object)
+            for row_idx, row in enumerate(rows):
+                self._values[row_idx, :len(row)] = row
+            # Empty-cell mask for the column/row scans, computed once per load.
+            # Any NaN becomes None here, so read paths only ever see None
+            self._empty = pd.isna(self._values)
+            self._values[self._empty] = None
+            
+            if col_range:
+                self._first_col = col_range[0]
         except Exception as e:
             if self.is_temp:
                 cleanup_temp_file(self.local_path)
@@ -100,7 +197,7 @@ class ExcelReader:
     
     def read_cell(self, cell_address: str) -> Any:
         """
-        Read a specific cell from the loaded DataFrame.
+        Read a specific cell from the loaded sheet.
         
         Args:
             cell_address: Cell address (e.g., 'A1', 'B5', 'C10')
@@ -115,28 +212,23 @@ class ExcelReader:
             reader = ExcelReader('sample_data.xlsx')
             value = reader.read_cell('C2')
         """
-        if self.dataframe is None:
-            raise RuntimeError("DataFrame not loaded")
+        if self._values is None:
+            raise RuntimeError("Sheet not loaded")
         
-        row_idx, col_idx = _parse_cell_address(cell_address)
+        row_idx, col_idx = parse_cell_address(cell_address)
         
         if row_idx < 0 or col_idx < 0:
             raise ValueError(f"Invalid cell address: {cell_address}")
         
-        if row_idx >= len(self.dataframe) or col_idx >= len(self.dataframe.columns):
-            return None
-        
-        value = self.dataframe.iloc[row_idx, col_idx]
-        
-        # Convert pandas NaN to None
-        if pd.isna(value):
+        col_idx -= self._first_col
+        if row_idx >= self._nrows or not 0 <= col_idx < self._ncols:
             return None
         
-        return value
+        return self._values[row_idx, col_idx]
     
     def read_cell_range(self, start_cell: str, end_cell: str) -> List[Any]:
         """
-        Read a range of cells from the loaded DataFrame.
+        Read a range of cells from the loaded sheet.
         
         Args:
             start_cell: Starting cell address (e.g., 'A1')
@@ -149,11 +241,11 @@ class ExcelReader:
             reader = ExcelReader('sample_data.xlsx')
             values = reader.read_cell_range('B2', 'C5')
         """
-        if self.dataframe is None:
-            raise RuntimeError("DataFrame not loaded")
+        if self._values is None:
+            raise RuntimeError("Sheet not loaded")
         
-        start_row, start_col = _parse_cell_address(start_cell)
-        end_row, end_col = _parse_cell_address(end_cell)
+        start_row, start_col = parse_cell_address(start_cell)
+        end_row, end_col = parse_cell_address(end_cell)
         
         # Ensure valid range
         if start_row > end_row or start_col > end_col:
@@ -162,20 +254,23 @@ class ExcelReader:
                 f"Start must be before end."
             )
         
-        values = []
-        for row_idx in range(start_row, end_row + 1):
-            for col_idx in range(start_col, end_col + 1):
-                if (row_idx < len(self.dataframe) and 
-                    col_idx < len(self.dataframe.columns)):
-                    value = self.dataframe.iloc[row_idx, col_idx]
-                    if pd.isna(value):
-                        values.append(None)
-                    else:
-                        values.append(value)
-                else:
-                    values.append(None)
-        
-        return values
+        n_rows = end_row - start_row + 1
+        n_cols = end_col - start_col + 1
+        # Columns relative to the loaded window
+        start_col -= self._first_col
+        end_col -= self._first_col
+        block = self._values[start_row:end_row + 1,
+                             max(start_col, 0):max(end_col + 1, 0)]
+        
+        if block.shape != (n_rows, n_cols):
+            # Pad the part of the range outside the loaded cells with empty cells
+            padded = np.full((n_rows, n_cols), None, dtype=object)
+            col_offset = max(-start_col, 0)
+            padded[:block.shape[0], col_offset:col_offset + block.shape[1]] = block
+            block = padded
+        
+        # One row-major pass over the block instead of per-cell lookups
+        return block.ravel(order='C').tolist()
     
     def is_cell_blank(self, cell_address: str) -> bool:
         """
@@ -224,11 +319,14 @@ class ExcelReader:
             'data_type': type(value).__name__ if value is not None else 'NoneType'
         }
     
-    def read_all_cells_in_column(self, column: str,
-                                 start_row: int = 1,
-                                 end_row: Optional[int] = None) -> List[Dict[str, Any]]:
+    def read_column_soa(self, column: str,
+                        start_row: int = 1,
+                        end_row: Optional[int] = None) -> Dict[str, Any]:
         """
-        Read all cells in a specific column.
+        Read all cells in a specific column as parallel arrays.
+        
+        Reads the same cells as read_all_cells_in_column, but returns one
+        list/array per field instead of one dictionary per cell.
         
         Args:
             column: Column letter (e.g., 'B', 'C')
@@ -236,59 +334,79 @@ class ExcelReader:
             end_row: Ending row number. If None, reads until first empty cell.
         
         Returns:
-            List of dictionaries with cell info:
-            [{'address': 'B1', 'value': ..., 'is_blank': ..., 'row': ...}, ...]
+            Dictionary with:
+            - 'addresses': List of cell addresses
+            - 'values': Object array of cell values (None if empty)
+            - 'is_blank': Boolean array, True where blank/null/N/A
+            - 'rows': Integer array of 1-based row numbers
         
         Example:
             reader = ExcelReader('sample_data.xlsx')
-            cells = reader.read_all_cells_in_column('C', start_row=2)
+            cells = reader.read_column_soa('C', start_row=2)
+            filled = cells['values'][~cells['is_blank']]
         """
-        if self.dataframe is None:
-            raise RuntimeError("DataFrame not loaded")
+        if self._values is None:
+            raise RuntimeError("Sheet not loaded")
         
-        col_idx = _parse_cell_address(f"{column}1")[1]
-        max_rows = len(self.dataframe)
+        col_idx = parse_cell_address(f"{column}1")[1] - self._first_col
+        first = max(start_row - 1, 0)  # Convert to 0-based
+        last = min(end_row, self._nrows) if end_row else self._nrows
+        last = min(last, 10001)  # Safety limit
         
-        results = []
-        row = start_row - 1  # Convert to 0-based
+        if 0 <= col_idx < self._ncols:
+            values = self._column_values()[first:last, col_idx].copy()
+            empty = self._empty[first:last, col_idx]
+        else:
+            values = np.full(max(last - first, 0), None, dtype=object)
+            empty = np.ones(len(values), dtype=bool)
         
-        while True:
-            if end_row and row >= end_row:
-                break
-            
-            if row >= max_rows:
-                break
-            
-            cell_address = f"{column}{row + 1}"  # Convert back to 1-based for address
-            
-            if row < len(self.dataframe) and col_idx < len(self.dataframe.columns):
-                value = self.dataframe.iloc[row, col_idx]
-                if pd.isna(value):
-                    value = None
-            else:
-                value = None
-            
-            # Stop if we hit empty cell and we're past start_row
-            if value is None and row >= start_row - 1:
-                if row > start_row - 1:
-                    break
-            
-            results.append({
-                'address': cell_address,
-                'value': value,
-                'is_blank': is_blank_or_na(value),
-                'row': row + 1  # Return 1-based row number
-            })
-            
-            row += 1
-            if row > 10000:  # Safety limit
-                break
+        # Stop at the first empty cell past start_row
+        stop = _find_first_empty(empty, 1)
+        values = values[:stop]
+        empty = empty[:stop]
         
-        return results
+        rows = np.arange(first + 1, first + 1 + len(values))
+        is_blank = empty | _blank_string_mask(values)
+        
+        return {
+            'addresses': [f"{column}{row}" for row in rows.tolist()],
+            'values': values,
+            'is_blank': is_blank,
+            'rows': rows
+        }
+    
+    def read_all_cells_in_column(self, column: str,
+                                 start_row: int = 1,
+                                 end_row: Optional[int] = None) -> List[ColumnCell]:
+        """
+        Read all cells in a specific column.
+        
+        Args:
+            column: Column letter (e.g., 'B', 'C')
+            start_row: Starting row number (default: 1, Excel 1-based)
+            end_row: Ending row number. If None, reads until first empty cell.
+        
+        Returns:
+            List of ColumnCell tuples (address, value, is_blank, row). Fields
+            can also be read by key, e.g. cell['value'].
+        
+        Example:
+            reader = ExcelReader('sample_data.xlsx')
+            cells = reader.read_all_cells_in_column('C', start_row=2)
+        """
+        cells = self.read_column_soa(column, start_row, end_row)
+        
+        return list(map(
+            ColumnCell,
+            cells['addresses'],
+            cells['values'].tolist(),
+            cells['is_blank'].tolist(),
+            cells['rows'].tolist()
+        ))
     
     def read_all_cells_in_row(self, row: int,
                               start_column: str = 'A',
-                              end_column: Optional[str] = None) -> List[Dict[str, Any]]:
+                              end_column: Optional[str] = None) -> List[RowCell]:
         """
         Read all cells in a specific row.
         
@@ -298,8 +416,8 @@ class ExcelReader:
             end_column: Ending column letter. If None, reads until first empty cell.
         
         Returns:
-            List of dictionaries with cell info:
-            [{'address': 'A2', 'value': ..., 'is_blank': ..., 'column': ...}, ...]
+            List of RowCell tuples (address, value, is_blank, column). Fields
+            can also be read by key, e.g. cell['value'].
         
         Example:
             reader = ExcelReader('sample_data.xlsx')
@@ -309,80 +427,80 @@ class ExcelReader:
             # Read row 5 from column A to column D
             cells = reader.read_all_cells_in_row(5, start_column='A', end_column='D')
         """
-        if self.dataframe is None:
-            raise RuntimeError("DataFrame not loaded")
+        if self._values is None:
+            raise RuntimeError("Sheet not loaded")
         
         row_idx = row - 1  # Convert to 0-based
-        start_col_idx = _parse_cell_address(f"{start_column}1")[1]
-        max_cols = len(self.dataframe.columns)
+        start_col_idx = parse_cell_address(f"{start_column}1")[1]
+        max_cols = self._first_col + self._ncols
         
         if end_column:
-            end_col_idx = _parse_cell_address(f"{end_column}1")[1]
+            end_col_idx = parse_cell_address(f"{end_column}1")[1]
         else:
             end_col_idx = None
         
-        if row_idx < 0 or row_idx >= len(self.dataframe):
+        if row_idx < 0 or row_idx >= self._nrows:
             return []
         
-        results = []
-        col_idx = start_col_idx
+        # All bounds, including the safety limit, are applied once up front
+        last_col_idx = max_cols - 1
+        if end_col_idx is not None:
+            last_col_idx = min(last_col_idx, end_col_idx)
+        last_col_idx = min(last_col_idx, 10000)  # Safety limit
         
-        while True:
-            if end_col_idx is not None and col_idx > end_col_idx:
-                break
-            
-            if col_idx >= max_cols:
-                break
-            
-            # Convert column index to letter
-            col_letter = self._column_index_to_letter(col_idx)
-            cell_address = f"{col_letter}{row}"
-            
-            if col_idx < len(self.dataframe.columns):
-                value = self.dataframe.iloc[row_idx, col_idx]
-                if pd.isna(value):
-                    value = None
-            else:
-                value = None
-            
-            # Stop if we hit empty cell and we're past start_column
-            if value is None and col_idx > start_col_idx:
-                if end_col_idx is None:  # Only stop early if no end_column specified
-                    break
-            
-            results.append({
-                'address': cell_address,
-                'value': value,
-                'is_blank': is_blank_or_na(value),
-                'column': col_letter
-            })
-            
-            col_idx += 1
-            if col_idx > 10000:  # Safety limit
-                break
+        n_cols = last_col_idx - start_col_idx + 1
+        if n_cols <= 0:
+            return []
+        
+        # Columns left of the loaded window read as empty cells
+        values = np.full(n_cols, None, dtype=object)
+        empty = np.ones(n_cols, dtype=bool)
+        lo = start_col_idx - self._first_col
+        hi = last_col_idx - self._first_col + 1
+        if hi > 0:
+            offset = max(-lo, 0)
+            values[offset:] = self._values[row_idx, max(lo, 0):hi]
+            empty[offset:] = self._empty[row_idx, max(lo, 0):hi]
+        
+        # Stop at the first empty cell past start_column, unless an
+        # end_column was given
+        if end_col_idx is None:
+            stop = _find_first_empty(empty, 1)
+            values = values[:stop]
+            empty = empty[:stop]
+        
+        is_blank = empty | _blank_string_mask(values)
+        
+        results = []
+        for col_idx, value, blank in zip(
+            range(start_col_idx, start_col_idx + len(values)),
+            values.tolist(),
+            is_blank.tolist()
+        ):
+            col_letter = column_index_to_letter(col_idx)
+            results.append(RowCell(f"{col_letter}{row}", value, blank, col_letter))
         
         return results
     
-    @staticmethod
-    def _column_index_to_letter(col_idx: int) -> str:
+    def _column_values(self) -> np.ndarray:
         """
-        Convert 0-based column index to Excel column letter(s).
-        
-        Args:
-            col_idx: 0-based column index (0 = A, 1 = B, ..., 25 = Z, 26 = AA, etc.)
-        
-        Returns:
-            Excel column letter(s) (e.g., 'A', 'B', 'AA', 'AB')
+        Get the cell values in column-major order, so that column reads
+        are contiguous. Built on first use and shares the cell objects
+        with the row-major array.
         """
-        result = ""
-        col_idx += 1  # Convert to 1-based for calculation
-        
-        while col_idx > 0:
-            col_idx -= 1
-            result = chr(ord('A') + (col_idx % 26)) + result
-            col_idx //= 26
-        
-        return result
+        if self._values_by_column is None:
+            self._values_by_column = np.asfortranarray(self._values)
+        return self._values_by_column
+    
+    @property
+    def dataframe(self) -> Optional[pd.DataFrame]:
+        """The loaded cells as a pandas DataFrame, built on first access."""
+        if self._dataframe is None and self._values is not None:
+            columns = range(self._first_col, self._first_col + self._ncols)
+            self._dataframe = pd.DataFrame(
+                self._values, columns=columns
+            ).infer_objects()
+        return self._dataframe
     
     def get_dataframe(self) -> pd.DataFrame:
         """
@@ -391,7 +509,7 @@ class ExcelReader:
         Returns:
             The pandas DataFrame containing the Excel data
         """
-        if self.dataframe is None:
+        if self._values is None:
             raise RuntimeError("DataFrame not loaded")
         return self.dataframe
     
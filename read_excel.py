@@ -3,9 +3,54 @@ Functions to read Excel files cell-wise and check for blank/null/N/A values.
 Supports both local file paths and AWS S3 URIs.
 """
 
-from typing import Any, Optional, List, Dict
-from openpyxl import load_workbook
-from utils import get_local_path, is_blank_or_na, cleanup_temp_file
+import os
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain, repeat
+from typing import Any, Optional, List, Dict, Iterator
+from utils import (
+    local_excel, is_blank_or_na, load_sheet, ColumnCell, RowCell, parse_cell_address,
+    column_index_to_letter, letter_to_column_index
+)
+
+
+@lru_cache(maxsize=8)
+def _open_sheet(local_path: str, mtime: float,
+                sheet_name: Optional[str]) -> List[List[Any]]:
+    """
+    Load sheet rows, caching the result across calls.
+    
+    The file's modification time is part of the cache key so that a file
+    changed on disk is parsed again. Callers must not mutate the result.
+    """
+    return load_sheet(local_path, sheet_name)[1]
+
+
+@contextmanager
+def _opened_sheet(excel_path: str,
+                  sheet_name: Optional[str]) -> Iterator[List[List[Any]]]:
+    """
+    Resolve excel_path to a local file and yield the sheet's rows.
+    
+    Rows come from the _open_sheet cache, and S3 files from the download
+    cache in get_local_path, so repeated reads of an unchanged object
+    neither download nor parse it again.
+    """
+    with local_excel(excel_path) as local_path:
+        yield _open_sheet(local_path, os.path.getmtime(local_path), sheet_name)
+
+
+def _get_value(rows: List[List[Any]], row_idx: int, col_idx: int) -> Any:
+    """
+    Get a cell value from loaded sheet rows (0-based indices).
+    
+    Returns None for cells outside the used area of the sheet.
+    """
+    if 0 <= row_idx < len(rows):
+        row = rows[row_idx]
+        if 0 <= col_idx < len(row):
+            return row[col_idx]
+    return None
 
 
 def read_cell(excel_path: str, cell_address: str, sheet_name: Optional[str] = None) -> Any:
@@ -15,7 +60,7 @@ def read_cell(excel_path: str, cell_address: str, sheet_name: Optional[str] = No
     Args:
         excel_path: Path to the Excel file (local path or S3 URI like 's3://bucket/file.xlsx')
         cell_address: Cell address (e.g., 'A1', 'B5', 'C10')
-        sheet_name: Optional sheet name. If None, uses the active sheet.
+        sheet_name: Optional sheet name. If None, uses the first sheet.
     
     Returns:
         The cell value, or None if cell is empty
@@ -32,30 +77,9 @@ def read_cell(excel_path: str, cell_address: str, sheet_name: Optional[str] = No
         # S3 URI
         value = read_cell('s3://my-bucket/data/file.xlsx', 'C2')
     """
-    local_path, is_temp = get_local_path(excel_path)
-    
-    try:
-        workbook = load_workbook(local_path, data_only=True)
-        
-        if sheet_name:
-            if sheet_name not in workbook.sheetnames:
-                available = workbook.sheetnames
-                workbook.close()
-                raise ValueError(
-                    f"Sheet '{sheet_name}' not found. Available sheets: {available}"
-                )
-            sheet = workbook[sheet_name]
-        else:
-            sheet = workbook.active
-        
-        cell = sheet[cell_address]
-        value = cell.value
-        
-        workbook.close()
-        return value
-    finally:
-        if is_temp:
-            cleanup_temp_file(local_path)
+    with _opened_sheet(excel_path, sheet_name) as rows:
+        row_idx, col_idx = parse_cell_address(cell_address)
+        return _get_value(rows, row_idx, col_idx)
 
 
 def read_cell_range(excel_path: str, start_cell: str, end_cell: str,
@@ -67,7 +91,7 @@ def read_cell_range(excel_path: str, start_cell: str, end_cell: str,
         excel_path: Path to the Excel file (local path or S3 URI)
         start_cell: Starting cell address (e.g., 'A1')
         end_cell: Ending cell address (e.g., 'C10')
-        sheet_name: Optional sheet name. If None, uses the active sheet.
+        sheet_name: Optional sheet name. If None, uses the first sheet.
     
     Returns:
         List of cell values in row-major order
@@ -83,32 +107,16 @@ def read_cell_range(excel_path: str, start_cell: str, end_cell: str,
         # S3 URI
         values = read_cell_range('s3://my-bucket/data/file.xlsx', 'B2', 'C5')
     """
-    local_path, is_temp = get_local_path(excel_path)
-    
-    try:
-        workbook = load_workbook(local_path, data_only=True)
-        
-        if sheet_name:
-            if sheet_name not in workbook.sheetnames:
-                available = workbook.sheetnames
-                workbook.close()
-                raise ValueError(
-                    f"Sheet '{sheet_name}' not found. Available sheets: {available}"
-                )
-            sheet = workbook[sheet_name]
-        else:
-            sheet = workbook.active
+    with _opened_sheet(excel_path, sheet_name) as rows:
+        start_row, start_col = parse_cell_address(start_cell)
+        end_row, end_col = parse_cell_address(end_cell)
         
         values = []
-        for row in sheet[start_cell:end_cell]:
-            for cell in row:
-                values.append(cell.value)
+        for row_idx in range(start_row, end_row + 1):
+            for col_idx in range(start_col, end_col + 1):
+                values.append(_get_value(rows, row_idx, col_idx))
         
-        workbook.close()
         return values
-    finally:
-        if is_temp:
-            cleanup_temp_file(local_path)
 
 
 def is_cell_blank(excel_path: str, cell_address: str,
@@ -120,7 +128,7 @@ def is_cell_blank(excel_path: str, cell_address: str,
     Args:
         excel_path: Path to the Excel file (local path or S3 URI)
         cell_address: Cell address (e.g., 'A1', 'B5', 'C10')
-        sheet_name: Optional sheet name. If None, uses the active sheet.
+        sheet_name: Optional sheet name. If None, uses the first sheet.
     
     Returns:
         True if cell is blank/null/N/A, False otherwise
@@ -150,7 +158,7 @@ def check_cell_value(excel_path: str, cell_address: str,
     Args:
         excel_path: Path to the Excel file (local path or S3 URI)
         cell_address: Cell address (e.g., 'A1', 'B5')
-        sheet_name: Optional sheet name. If None, uses the active sheet.
+        sheet_name: Optional sheet name. If None, uses the first sheet.
     
     Returns:
         Dictionary with:
@@ -185,7 +193,7 @@ def check_cell_value(excel_path: str, cell_address: str,
 
 def read_all_cells_in_column(excel_path: str, column: str,
                              start_row: int = 1, end_row: Optional[int] = None,
-                             sheet_name: Optional[str] = None) -> List[Dict[str, Any]]:
+                             sheet_name: Optional[str] = None) -> List[ColumnCell]:
     """
     Read all cells in a specific column.
     
@@ -194,11 +202,11 @@ def read_all_cells_in_column(excel_path: str, column: str,
         column: Column letter (e.g., 'B', 'C')
         start_row: Starting row number (default: 1)
         end_row: Ending row number. If None, reads until first empty cell.
-        sheet_name: Optional sheet name. If None, uses the active sheet.
+        sheet_name: Optional sheet name. If None, uses the first sheet.
     
     Returns:
-        List of dictionaries with cell info:
-        [{'address': 'B1', 'value': ..., 'is_blank': ..., 'row': ...}, ...]
+        List of ColumnCell tuples (address, value, is_blank, row). Fields
+        can also be read by key, e.g. cell['value'].
     
     Raises:
         FileNotFoundError: If file not found
@@ -211,97 +219,36 @@ def read_all_cells_in_column(excel_path: str, column: str,
         # S3 URI
         cells = read_all_cells_in_column('s3://my-bucket/data/file.xlsx', 'C', start_row=2)
     """
-    local_path, is_temp = get_local_path(excel_path)
     max_rows = 10000
     
-    try:
-        workbook = load_workbook(local_path, data_only=True)
+    with _opened_sheet(excel_path, sheet_name) as rows:
+        col_idx = letter_to_column_index(column)
+        last_row = min(end_row, max_rows) if end_row else max_rows
         
-        if sheet_name:
-            if sheet_name not in workbook.sheetnames:
-                available = workbook.sheetnames
-                workbook.close()
-                raise ValueError(
-                    f"Sheet '{sheet_name}' not found. Available sheets: {available}"
-                )
-            sheet = workbook[sheet_name]
-        else:
-            sheet = workbook.active
+        # Slice the column out of the sheet once instead of looking up
+        # cell by cell; rows past the used area read as empty
+        column_values = [
+            sheet_row[col_idx] if col_idx < len(sheet_row) else None
+            for sheet_row in rows[start_row - 1:last_row]
+        ]
         
         results = []
-        row = start_row
-        
-        while True:
-            if end_row and row > end_row:
+        for row, value in zip(range(start_row, last_row + 1),
+                              chain(column_values, repeat(None))):
+            if value is None and row > start_row + 1:
                 break
             
-            cell_address = f"{column}{row}"
-            cell = sheet[cell_address]
-            value = cell.value
-            
-            if value is None and row > start_row:
-                if row > start_row + 1:
-                    break
-            
-            results.append({
-                'address': cell_address,
-                'value': value,
-                'is_blank': is_blank_or_na(value),
-                'row': row
-            })
-            
-            row += 1
-            if row > max_rows:
-                break
+            results.append(
+                ColumnCell(f"{column}{row}", value, is_blank_or_na(value), row)
+            )
         
-        workbook.close()
         return results
-    finally:
-        if is_temp:
-            cleanup_temp_file(local_path)
-
-
-def _column_index_to_letter(col_idx: int) -> str:
-    """
-    Convert 0-based column index to Excel column letter(s).
-    
-    Args:
-        col_idx: 0-based column index (0 = A, 1 = B, ..., 25 = Z, 26 = AA, etc.)
-    
-    Returns:
-        Excel column letter(s) (e.g., 'A', 'B', 'AA', 'AB')
-    """
-    result = ""
-    col_idx += 1  # Convert to 1-based for calculation
-    
-    while col_idx > 0:
-        col_idx -= 1
-        result = chr(ord('A') + (col_idx % 26)) + result
-        col_idx //= 26
-    
-    return result
-
-
-def _letter_to_column_index(column: str) -> int:
-    """
-    Convert Excel column letter(s) to 0-based column index.
-    
-    Args:
-        column: Excel column letter(s) (e.g., 'A', 'B', 'AA', 'AB')
-    
-    Returns:
-        0-based column index
-    """
-    col_num = 0
-    for char in column.upper():
-        col_num = col_num * 26 + (ord(char) - ord('A') + 1)
-    return col_num - 1  # Make it 0-based
 
 
 def read_all_cells_in_row(excel_path: str, row: int,
                           start_column: str = 'A',
                           end_column: Optional[str] = None,
-                          sheet_name: Optional[str] = None) -> List[Dict[str, Any]]:
+                          sheet_name: Optional[str] = None) -> List[RowCell]:
     """
     Read all cells in a specific row.
     
@@ -310,11 +257,11 @@ def read_all_cells_in_row(excel_path: str, row: int,
         row: Row number (1-based, Excel notation)
         start_column: Starting column letter (default: 'A')
         end_column: Ending column letter. If None, reads until first empty cell.
-        sheet_name: Optional sheet name. If None, uses the active sheet.
+        sheet_name: Optional sheet name. If None, uses the first sheet.
     
     Returns:
-        List of dictionaries with cell info:
-        [{'address': 'A2', 'value': ..., 'is_blank': ..., 'column': ...}, ...]
+        List of RowCell tuples (address, value, is_blank, column). Fields
+        can also be read by key, e.g. cell['value'].
     
     Raises:
         FileNotFoundError: If file not found
@@ -330,62 +277,33 @@ def read_all_cells_in_row(excel_path: str, row: int,
         # S3 URI
         cells = read_all_cells_in_row('s3://my-bucket/data/file.xlsx', 2, start_column='B')
     """
-    local_path, is_temp = get_local_path(excel_path)
     max_cols = 10000
     
-    try:
-        workbook = load_workbook(local_path, data_only=True)
-        
-        if sheet_name:
-            if sheet_name not in workbook.sheetnames:
-                available = workbook.sheetnames
-                workbook.close()
-                raise ValueError(
-                    f"Sheet '{sheet_name}' not found. Available sheets: {available}"
-                )
-            sheet = workbook[sheet_name]
-        else:
-            sheet = workbook.active
-        
-        start_col_idx = _letter_to_column_index(start_column)
+    with _opened_sheet(excel_path, sheet_name) as rows:
+        start_col_idx = letter_to_column_index(start_column)
         end_col_idx = None
         if end_column:
-            end_col_idx = _letter_to_column_index(end_column)
+            end_col_idx = letter_to_column_index(end_column)
         
-        results = []
-        col_idx = start_col_idx
+        last_col_idx = min(end_col_idx, max_cols) if end_col_idx is not None else max_cols
         
-        while True:
-            if end_col_idx is not None and col_idx > end_col_idx:
-                break
-            
-            col_letter = _column_index_to_letter(col_idx)
-            cell_address = f"{col_letter}{row}"
-            
-            try:
-                cell = sheet[cell_address]
-                value = cell.value
-            except (AttributeError, IndexError):
-                value = None
-            
+        # Slice the row out of the sheet once instead of looking up
+        # cell by cell; columns past the used area read as empty
+        row_values = []
+        if 0 < row <= len(rows):
+            row_values = rows[row - 1][start_col_idx:last_col_idx + 1]
+        
+        results = []
+        for col_idx, value in zip(range(start_col_idx, last_col_idx + 1),
+                                  chain(row_values, repeat(None))):
             # Stop if we hit empty cell and we're past start_column
             if value is None and col_idx > start_col_idx:
                 if end_col_idx is None:  # Only stop early if no end_column specified
                     break
             
-            results.append({
-                'address': cell_address,
-                'value': value,
-                'is_blank': is_blank_or_na(value),
-                'column': col_letter
-            })
-            
-            col_idx += 1
-            if col_idx > max_cols:
-                break
+            col_letter = column_index_to_letter(col_idx)
+            results.append(
+                RowCell(f"{col_letter}{row}", value, is_blank_or_na(value), col_letter)
+            )
         
-        workbook.close()
         return results
-    finally:
-        if is_temp:
-            cleanup_temp_file(local_path)
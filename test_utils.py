@@ -0,0 +1,63 @@
+"""
+Tests for utils.py that don't need S3: downloads are replaced by local
+temporary files.
+
+Run with: python -m unittest test_utils
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import utils
+
+
+def _fake_download(s3_uri: str) -> str:
+    """Stand-in for download_from_s3 that writes a temp file."""
+    fd, local_path = tempfile.mkstemp(suffix='.xlsx')
+    with os.fdopen(fd, 'wb') as file_obj:
+        file_obj.write(s3_uri.encode())
+    return local_path
+
+
+class GetLocalPathsTest(unittest.TestCase):
+
+    def setUp(self):
+        utils.clear_s3_cache()
+        patches = [
+            mock.patch.object(utils, 'get_s3_etag', return_value='"etag"'),
+            mock.patch.object(utils, 'download_from_s3', side_effect=_fake_download),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.addCleanup(utils.clear_s3_cache)
+
+    def test_batch_larger_than_cache_returns_existing_files(self):
+        s3_uris = [f"s3://bucket/file{i}.xlsx" for i in range(utils.S3_CACHE_SIZE + 8)]
+
+        results = utils.get_local_paths(s3_uris)
+        try:
+            self.assertEqual(len(results), len(s3_uris))
+            for local_path, is_temp in results:
+                self.assertTrue(os.path.exists(local_path))
+                self.assertTrue(is_temp)
+        finally:
+            for local_path, is_temp in results:
+                if is_temp:
+                    utils.cleanup_temp_file(local_path)
+
+    def test_batch_within_cache_uses_cache(self):
+        s3_uris = ['s3://bucket/a.xlsx', 's3://bucket/b.xlsx', 's3://bucket/a.xlsx']
+
+        results = utils.get_local_paths(s3_uris)
+
+        self.assertEqual(results[0], results[2])
+        for local_path, is_temp in results:
+            self.assertTrue(os.path.exists(local_path))
+            self.assertFalse(is_temp)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,18 +3,205 @@ Utility functions for Excel file operations.
 Reusable functions for S3 handling, path validation, and value checking.
 """
 
+import atexit
+import datetime
+import importlib.util
 import os
+import random
 import tempfile
-from typing import Any, Tuple, Optional
-from pathlib import Path
-from urllib.parse import urlparse
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Iterator, List, NamedTuple, Tuple, Optional, Union
+
+# boto3 takes a few hundred ms to import, so only check that it is
+# installed here; _load_boto3() imports it on first S3 use
+BOTO3_AVAILABLE = importlib.util.find_spec('boto3') is not None
+AIOBOTO3_AVAILABLE = importlib.util.find_spec('aioboto3') is not None
+boto3 = None
+aioboto3 = None
+TransferConfig = Config = ClientError = NoCredentialsError = None
 
 try:
-    import boto3
-    from botocore.exceptions import ClientError, NoCredentialsError
-    BOTO3_AVAILABLE = True
+    from python_calamine import CalamineWorkbook
+    CALAMINE_AVAILABLE = True
 except ImportError:
-    BOTO3_AVAILABLE = False
+    CALAMINE_AVAILABLE = False
+
+# Whole numbers below this are written to the sheet XML as plain digits
+# (by Excel and by openpyxl, which uses repr); from here on they use
+# exponent form, which openpyxl reads back as float
+_MAX_PLAIN_INT = 1e16
+
+# Strings treated as blank by is_blank_or_na, after strip() and upper()
+BLANK_VALUES = frozenset({'', 'N/A', 'NA', 'NULL', 'NONE', '#N/A', '#NA'})
+
+# Objects larger than this are downloaded as concurrent ranged GETs of this size
+S3_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+
+# Bytes read from the response stream per call while downloading
+_S3_IO_CHUNKSIZE = 1024 * 1024
+
+# Error codes S3 uses for throttling/transient overload; downloads that fail
+# with one of these are restarted once after a short pause
+_S3_THROTTLE_CODES = frozenset({
+    'SlowDown', 'ServiceUnavailable', 'Throttling', 'ThrottlingException',
+    'RequestLimitExceeded', 'TooManyRequestsException', '503'
+})
+_S3_DOWNLOAD_ATTEMPTS = 2
+_S3_RESTART_DELAY = 1.0
+
+# Attempts botocore makes per request (adaptive mode) within one transfer
+_S3_REQUEST_ATTEMPTS = 5
+
+# get_local_stream keeps S3 downloads up to this size in memory
+S3_STREAM_MAX_MEMORY = 64 * 1024 * 1024
+
+# Downloaded S3 files, least recently used first: URI -> (ETag, local path)
+S3_CACHE_SIZE = 32
+_S3_CACHE: 'OrderedDict[str, Tuple[str, str]]' = OrderedDict()
+_S3_CACHE_LOCK = threading.Lock()
+
+# Process umask, read once at import: os.umask can only be read by setting
+# it, which would race with files other threads are creating
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Shared S3 client, created on first use
+_S3_CLIENT = None
+_S3_CLIENT_LOCK = threading.Lock()
+
+_DIGITS = '0123456789'
+_LETTERS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+# Column letters <-> 0-based column index for every column Excel allows
+# ('A'..'XFD'), built once at import so lookups never loop
+_MAX_COLUMNS = 16384
+
+
+def _build_column_letters(count: int) -> List[str]:
+    """Column letters of the first count columns: 'A'..'Z', 'AA'..'ZZ', 'AAA'..."""
+    letters: List[str] = []
+    level = ['']
+    while len(letters) < count:
+        level = [prefix + char for prefix in level for char in _LETTERS]
+        letters.extend(level)
+    return letters[:count]
+
+
+_IDX_TO_COL = _build_column_letters(_MAX_COLUMNS)
+_COL_TO_IDX = {letter: idx for idx, letter in enumerate(_IDX_TO_COL)}
+
+
+def parse_cell_address(cell_address: str) -> tuple[int, int]:
+    """
+    Parse Excel cell address (e.g., 'A1', 'B5') to (row, col) indices.
+    
+    Args:
+        cell_address: Excel cell address like 'A1', 'B5', 'AA10'
+    
+    Returns:
+        Tuple of (row_index, column_index) where both are 0-based
+    
+    Raises:
+        ValueError: If cell address format is invalid
+    """
+    # Split the row digits off with str methods instead of a regex match
+    col_str = cell_address.rstrip(_DIGITS)
+    row_str = cell_address[len(col_str):]
+    if not row_str or not (col_str.isascii() and col_str.isalpha()):
+        raise ValueError(f"Invalid cell address format: {cell_address}")
+    
+    return int(row_str) - 1, letter_to_column_index(col_str)
+
+
+def column_index_to_letter(col_idx: int) -> str:
+    """
+    Convert 0-based column index to Excel column letter(s).
+    
+    Args:
+        col_idx: 0-based column index (0 = A, 1 = B, ..., 25 = Z, 26 = AA, etc.)
+    
+    Returns:
+        Excel column letter(s) (e.g., 'A', 'B', 'AA', 'AB')
+    """
+    if 0 <= col_idx < _MAX_COLUMNS:
+        return _IDX_TO_COL[col_idx]
+    
+    result = ""
+    n = col_idx + 1  # Convert to 1-based for calculation
+    
+    while n > 0:
+        n -= 1
+        result = chr(ord('A') + (n % 26)) + result
+        n //= 26
+    
+    return result
+
+
+def letter_to_column_index(column: str) -> int:
+    """
+    Convert Excel column letter(s) to 0-based column index.
+    
+    Args:
+        column: Excel column letter(s) (e.g., 'A', 'B', 'AA', 'AB')
+    
+    Returns:
+        0-based column index
+    """
+    col_num = _COL_TO_IDX.get(column)
+    if col_num is None:
+        # Lowercase letters, or a column past the table
+        col_num = 0
+        for char in column.upper():
+            col_num = col_num * 26 + (ord(char) - ord('A') + 1)
+        col_num -= 1  # Make it 0-based
+    return col_num
+
+
+def _get_field(cell: tuple, key: Any) -> Any:
+    """Look a field up by name (e.g., cell['value']) as well as by position."""
+    if isinstance(key, str):
+        if key not in cell._fields:
+            raise KeyError(key)
+        return getattr(cell, key)
+    return tuple.__getitem__(cell, key)
+
+
+class ColumnCell(NamedTuple):
+    """
+    One cell from a column scan.
+    
+    Fields can be read as attributes (cell.value) or by key
+    (cell['value']). Only key indexing carries over from the dictionaries
+    returned before: 'in', .get(), .keys(), .items() and JSON dumping
+    behave like a tuple, so use cell._asdict() where a dict is needed.
+    """
+    address: str
+    value: Any
+    is_blank: bool
+    row: int
+    
+    __getitem__ = _get_field
+
+
+class RowCell(NamedTuple):
+    """
+    One cell from a row scan.
+    
+    Fields can be read as attributes (cell.value) or by key
+    (cell['value']). Only key indexing carries over from the dictionaries
+    returned before: 'in', .get(), .keys(), .items() and JSON dumping
+    behave like a tuple, so use cell._asdict() where a dict is needed.
+    """
+    address: str
+    value: Any
+    is_blank: bool
+    column: str
+    
+    __getitem__ = _get_field
 
 
 def is_s3_uri(path: str) -> bool:
@@ -30,40 +217,131 @@ def is_s3_uri(path: str) -> bool:
     return path.startswith('s3://')
 
 
-def download_from_s3(s3_uri: str, local_path: Optional[str] = None) -> str:
+def _parse_s3_uri(s3_uri: str) -> Tuple[str, str]:
     """
-    Download a file from S3 to a local temporary file.
+    Split an S3 URI into bucket name and key.
     
-    Args:
-        s3_uri: S3 URI (e.g., 's3://bucket-name/path/to/file.xlsx')
-        local_path: Optional local path to save the file. If None, creates a temp file.
+    Raises:
+        ValueError: If S3 URI is invalid
+    """
+    # The URI is always s3://bucket/key, so two string operations suffice
+    bucket_name, _, s3_key = s3_uri[len('s3://'):].partition('/')
+    s3_key = s3_key.lstrip('/')
     
-    Returns:
-        Path to the local file
+    if not bucket_name or not s3_key:
+        raise ValueError(
+            f"Invalid S3 URI: {s3_uri}. "
+            f"Expected format: s3://bucket-name/path/to/file.xlsx"
+        )
+    
+    return bucket_name, s3_key
+
+
+def _load_boto3() -> None:
+    """
+    Import boto3 and the botocore classes this module uses, on first call.
     
     Raises:
         ImportError: If boto3 is not installed
-        ValueError: If S3 URI is invalid
-        RuntimeError: If AWS credentials are not configured or download fails
-        FileNotFoundError: If file or bucket not found in S3
     """
+    global boto3, TransferConfig, Config, ClientError, NoCredentialsError
+    
+    if boto3 is not None:
+        return
+    
     if not BOTO3_AVAILABLE:
         raise ImportError(
             "boto3 is required for S3 support. Install it with: pip install boto3"
         )
     
-    parsed = urlparse(s3_uri)
-    bucket_name = parsed.netloc
-    s3_key = parsed.path.lstrip('/')
+    from boto3.s3.transfer import TransferConfig
+    from botocore.config import Config
+    from botocore.exceptions import ClientError, NoCredentialsError
+    import boto3  # Bound last: a non-None boto3 means everything is loaded
+
+
+def _get_s3_client():
+    """
+    Get the shared boto3 S3 client, creating it on first use.
     
-    if not bucket_name or not s3_key:
-        raise ValueError(
-            f"Invalid S3 URI: {s3_uri}. "
-            f"Expected format: s3://bucket-name/path/to/file.xlsx"
-        )
+    Building a client loads the service model and resolves credentials and
+    endpoints, so it is done once per process; boto3 clients are safe to
+    share between threads. The client's connection pool is large enough
+    for concurrent multipart downloads.
+    
+    Raises:
+        ImportError: If boto3 is not installed
+        RuntimeError: If AWS credentials are not configured
+    """
+    global _S3_CLIENT
+    
+    if _S3_CLIENT is not None:
+        return _S3_CLIENT
+    
+    _load_boto3()
+    
+    with _S3_CLIENT_LOCK:
+        if _S3_CLIENT is None:
+            _S3_CLIENT = _create_s3_client()
+    return _S3_CLIENT
+
+
+def warm_s3_client(s3_uri: Optional[str] = None) -> bool:
+    """
+    Create the shared S3 client ahead of the first download and, given an
+    S3 URI (or bare bucket name), open a connection to that bucket's
+    endpoint, so the first real download does not pay for DNS lookup and
+    the TLS handshake.
+    
+    Warming is best effort: failures (no permission for HeadBucket,
+    unreachable endpoint, ...) are swallowed; the real download reports
+    errors as usual.
+    
+    Args:
+        s3_uri: Optional S3 URI or bucket name to connect to. Each bucket
+            has its own endpoint, so only connections to this bucket are warmed.
+    
+    Returns:
+        True if the client was created and, when requested, the connection
+        was opened; False otherwise
+    
+    Example:
+        warm_s3_client('s3://my-bucket/data/file.xlsx')
+    """
+    try:
+        s3_client = _get_s3_client()
+    except (ImportError, RuntimeError):
+        return False
+    
+    if s3_uri is None:
+        return True
+    
+    bucket_name = s3_uri
+    if s3_uri.startswith('s3://'):
+        bucket_name = s3_uri[len('s3://'):].partition('/')[0]
+    
+    try:
+        s3_client.head_bucket(Bucket=bucket_name)
+    except Exception:
+        return False
+    return True
+
+
+def _create_s3_client():
+    """
+    Create a boto3 S3 client tuned for downloads.
+    
+    Raises:
+        RuntimeError: If AWS credentials are not configured
+    """
+    config = Config(
+        max_pool_connections=50,
+        retries={'mode': 'adaptive', 'total_max_attempts': _S3_REQUEST_ATTEMPTS},
+        tcp_keepalive=True
+    )
     
     try:
-        s3_client = boto3.client('s3')
+        return boto3.client('s3', config=config)
     except NoCredentialsError as e:
         raise RuntimeError(
             "AWS credentials not found. Please configure AWS credentials using:\n"
@@ -71,46 +349,630 @@ def download_from_s3(s3_uri: str, local_path: Optional[str] = None) -> str:
             "  - Environment variables: AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY\n"
             "  - IAM role (if running on EC2)"
         ) from e
+
+
+def _s3_error(error: 'ClientError', s3_uri: str, bucket_name: str,
+              action: str) -> Exception:
+    """
+    Translate a botocore ClientError into the exception this module raises.
     
-    if local_path is None:
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx')
-        local_path = temp_file.name
-        temp_file.close()
+    HEAD requests (including the one a download starts with) have no
+    response body, so a missing key reports a bare 404.
+    """
+    error_code = error.response.get('Error', {}).get('Code', '')
+    if error_code in ('404', 'NoSuchKey'):
+        return FileNotFoundError(f"File not found in S3: {s3_uri}")
+    if error_code == 'NoSuchBucket':
+        return FileNotFoundError(f"S3 bucket not found: {bucket_name}")
+    return RuntimeError(f"Error {action}: {str(error)}")
+
+
+def get_s3_etag(s3_uri: str) -> str:
+    """
+    Get the ETag of an S3 object with a HEAD request, without downloading it.
+    
+    The ETag changes whenever the object is overwritten, so it can be used
+    to tell whether a previously downloaded copy is still current.
+    
+    Args:
+        s3_uri: S3 URI (e.g., 's3://bucket-name/path/to/file.xlsx')
+    
+    Returns:
+        The object's ETag
+    
+    Raises:
+        ImportError: If boto3 is not installed
+        ValueError: If S3 URI is invalid
+        RuntimeError: If AWS credentials are not configured or the request fails
+        FileNotFoundError: If file or bucket not found in S3
+    """
+    bucket_name, s3_key = _parse_s3_uri(s3_uri)
+    s3_client = _get_s3_client()
     
     try:
-        s3_client.download_file(bucket_name, s3_key, local_path)
-        return local_path
+        return s3_client.head_object(Bucket=bucket_name, Key=s3_key)['ETag']
     except ClientError as e:
-        error_code = e.response.get('Error', {}).get('Code', '')
-        if error_code == 'NoSuchKey':
-            raise FileNotFoundError(f"File not found in S3: {s3_uri}") from e
-        if error_code == 'NoSuchBucket':
-            raise FileNotFoundError(f"S3 bucket not found: {bucket_name}") from e
-        raise RuntimeError(f"Error downloading from S3: {str(e)}") from e
+        raise _s3_error(e, s3_uri, bucket_name, "reading S3 object metadata") from e
+
+
+def download_from_s3(s3_uri: str, local_path: Optional[str] = None,
+                     max_concurrency: int = 10) -> str:
+    """
+    Download a file from S3 to a local temporary file.
+    
+    Files larger than S3_MULTIPART_CHUNKSIZE are fetched as concurrent
+    ranged GETs, which overlap request latency and use more of the
+    available bandwidth than a single stream.
+    
+    Args:
+        s3_uri: S3 URI (e.g., 's3://bucket-name/path/to/file.xlsx')
+        local_path: Optional local path to save the file. If None, creates a temp file.
+            An existing file at this path is only overwritten once the download
+            has completed.
+        max_concurrency: Maximum number of parts downloaded at once (default: 10).
+            Use 1 to download on the calling thread only.
+    
+    Returns:
+        Path to the local file
+    
+    Raises:
+        ImportError: If boto3 is not installed
+        ValueError: If S3 URI is invalid
+        RuntimeError: If AWS credentials are not configured or download fails
+        FileNotFoundError: If file or bucket not found in S3
+    """
+    _parse_s3_uri(s3_uri)  # Reject invalid URIs before creating a temp file
+    s3_client = _get_s3_client()
+    
+    # Write through the already-open temp file instead of reopening it by name
+    fd, temp_path = _download_temp_file(local_path)
+    
+    try:
+        with os.fdopen(fd, 'wb') as file_obj:
+            _download_to_fileobj(s3_client, s3_uri, file_obj, max_concurrency)
+        return _finish_download(temp_path, local_path)
+    except Exception:
+        cleanup_temp_file(temp_path)
+        raise
 
 
-def get_local_path(excel_path: str) -> Tuple[str, bool]:
+def _download_temp_file(local_path: Optional[str]) -> Tuple[int, str]:
+    """
+    Create the temp file a download is written to.
+    
+    For an explicit local_path it is created next to it, so that
+    _finish_download can move it into place atomically; a failed download
+    then leaves any existing file at local_path untouched.
+    """
+    temp_dir = (os.path.dirname(local_path) or '.') if local_path is not None else None
+    return tempfile.mkstemp(suffix='.xlsx', dir=temp_dir)
+
+
+def _finish_download(temp_path: str, local_path: Optional[str]) -> str:
+    """Move a completed download onto local_path, if one was given."""
+    if local_path is None:
+        return temp_path
+    # mkstemp creates the file as 0o600; give it the mode open() would
+    os.chmod(temp_path, 0o666 & ~_UMASK)
+    os.replace(temp_path, local_path)
+    return local_path
+
+
+def _download_to_fileobj(s3_client, s3_uri: str, file_obj: BinaryIO,
+                         max_concurrency: int) -> None:
+    """
+    Download an S3 object into a writable, seekable binary file object.
+    
+    botocore already retries individual requests; if the transfer as a
+    whole still fails because S3 is throttling (503 SlowDown), it is
+    restarted from scratch once after a short pause.
+    
+    Worst case, a request is sent _S3_REQUEST_ATTEMPTS (5) times in each
+    of _S3_DOWNLOAD_ATTEMPTS (2) transfers, i.e. 10 GETs. botocore sleeps
+    at most 1 + 2 + 4 + 8 seconds between them per transfer, so with the
+    restart pause a persistently throttled download gives up after about
+    31 seconds of backoff plus the time the requests themselves take
+    (adaptive mode may also briefly rate-limit sends).
+    
+    Raises:
+        ValueError: If S3 URI is invalid
+        RuntimeError: If the download fails
+        FileNotFoundError: If file or bucket not found in S3
+    """
+    bucket_name, s3_key = _parse_s3_uri(s3_uri)
+    
+    config = TransferConfig(
+        multipart_threshold=S3_MULTIPART_CHUNKSIZE,
+        multipart_chunksize=S3_MULTIPART_CHUNKSIZE,
+        max_concurrency=max_concurrency,
+        use_threads=max_concurrency > 1,
+        io_chunksize=_S3_IO_CHUNKSIZE
+    )
+    
+    for attempt in range(_S3_DOWNLOAD_ATTEMPTS):
+        try:
+            s3_client.download_fileobj(bucket_name, s3_key, file_obj, Config=config)
+            return
+        except ClientError as e:
+            if attempt + 1 < _S3_DOWNLOAD_ATTEMPTS and _is_throttled(e):
+                time.sleep(_S3_RESTART_DELAY + random.uniform(0, 0.1))
+                # Drop whatever the failed attempt wrote
+                file_obj.seek(0)
+                file_obj.truncate()
+                continue
+            raise _s3_error(e, s3_uri, bucket_name, "downloading from S3") from e
+
+
+def _is_throttled(error: 'ClientError') -> bool:
+    """Check whether a ClientError means S3 is throttling or overloaded."""
+    error_code = error.response.get('Error', {}).get('Code', '')
+    status = error.response.get('ResponseMetadata', {}).get('HTTPStatusCode')
+    return error_code in _S3_THROTTLE_CODES or status == 503
+
+
+async def _download_with_client(client, s3_uri: str,
+                                local_path: Optional[str] = None) -> str:
+    """
+    Download one S3 object with an open aioboto3 client.
+    
+    Same contract as download_from_s3: a temp file is created when
+    local_path is None, and is removed again if the download fails. An
+    explicit local_path is only replaced once the download has succeeded,
+    since download_file truncates its target before the first request.
+    """
+    bucket_name, s3_key = _parse_s3_uri(s3_uri)
+    
+    fd, temp_path = _download_temp_file(local_path)
+    os.close(fd)
+    
+    try:
+        await client.download_file(bucket_name, s3_key, temp_path)
+        return _finish_download(temp_path, local_path)
+    except Exception as e:
+        cleanup_temp_file(temp_path)
+        if not isinstance(e, ClientError):
+            raise
+        raise _s3_error(e, s3_uri, bucket_name, "downloading from S3") from e
+
+
+def _aioboto3_session(session=None):
+    """
+    Get the aioboto3 session to use, creating one if none was given.
+    
+    Raises:
+        ImportError: If aioboto3 is not installed
+    """
+    global aioboto3
+    
+    _load_boto3()  # For ClientError
+    
+    if session is not None:
+        return session
+    if not AIOBOTO3_AVAILABLE:
+        raise ImportError(
+            "aioboto3 is required for async S3 downloads. "
+            "Install it with: pip install aioboto3"
+        )
+    if aioboto3 is None:
+        import aioboto3
+    return aioboto3.Session()
+
+
+async def download_from_s3_async(s3_uri: str, local_path: Optional[str] = None,
+                                 session=None) -> str:
+    """
+    Download a file from S3 without blocking the event loop.
+    
+    Args:
+        s3_uri: S3 URI (e.g., 's3://bucket-name/path/to/file.xlsx')
+        local_path: Optional local path to save the file. If None, creates a temp file.
+            An existing file at this path is only overwritten once the download
+            has completed.
+        session: Optional aioboto3.Session to create the client from
+    
+    Returns:
+        Path to the local file
+    
+    Raises:
+        ImportError: If aioboto3 is not installed
+        ValueError: If S3 URI is invalid
+        RuntimeError: If the download fails
+        FileNotFoundError: If file or bucket not found in S3
+    
+    Example:
+        local_path = await download_from_s3_async('s3://my-bucket/data/file.xlsx')
+    """
+    _parse_s3_uri(s3_uri)  # Reject invalid URIs before opening a client
+    
+    async with _aioboto3_session(session).client('s3') as client:
+        return await _download_with_client(client, s3_uri, local_path)
+
+
+async def download_many_async(s3_uris: List[str], max_concurrency: int = 16,
+                              session=None) -> List[str]:
+    """
+    Download many S3 files concurrently over one client.
+    
+    Args:
+        s3_uris: S3 URIs to download
+        max_concurrency: Maximum number of downloads in flight (default: 16)
+        session: Optional aioboto3.Session to create the client from
+    
+    Returns:
+        Paths to the local temp files, in the same order as s3_uris.
+        The caller is responsible for deleting them (see cleanup_temp_file).
+    
+    Raises:
+        Same as download_from_s3_async. If any download fails, the files
+        that did download are deleted and the first error is raised.
+    
+    Example:
+        paths = asyncio.run(download_many_async(['s3://bucket/a.xlsx', 's3://bucket/b.xlsx']))
+    """
+    import asyncio  # Only async callers pay for importing asyncio
+    
+    for s3_uri in s3_uris:
+        _parse_s3_uri(s3_uri)  # Reject invalid URIs before downloading any
+    
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async with _aioboto3_session(session).client('s3') as client:
+        async def download(s3_uri: str) -> str:
+            async with semaphore:
+                return await _download_with_client(client, s3_uri)
+        
+        results = await asyncio.gather(
+            *(download(s3_uri) for s3_uri in s3_uris), return_exceptions=True
+        )
+    
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        for result in results:
+            if not isinstance(result, BaseException):
+                cleanup_temp_file(result)
+        raise errors[0]
+    
+    return results
+
+
+def _cached_s3_download(s3_uri: str) -> str:
+    """
+    Get a local copy of an S3 file, downloading it only if it is not
+    cached yet or the object's ETag has changed since it was downloaded.
+    
+    The cache owns the downloaded files: they are deleted when evicted,
+    replaced, or at interpreter exit, even if a caller still holds the
+    path. Downloads run outside the lock, so different URIs can be
+    fetched concurrently.
+    """
+    etag = get_s3_etag(s3_uri)
+    
+    with _S3_CACHE_LOCK:
+        cached = _S3_CACHE.get(s3_uri)
+        if cached is not None and cached[0] == etag and os.path.exists(cached[1]):
+            _S3_CACHE.move_to_end(s3_uri)
+            return cached[1]
+    
+    local_path = download_from_s3(s3_uri)
+    
+    with _S3_CACHE_LOCK:
+        cached = _S3_CACHE.get(s3_uri)
+        if cached is not None and cached[0] == etag and os.path.exists(cached[1]):
+            # Another call downloaded the same version meanwhile and may
+            # already have handed its path out; keep that one
+            _S3_CACHE.move_to_end(s3_uri)
+            stale_paths = [local_path]
+            local_path = cached[1]
+        else:
+            replaced = _S3_CACHE.pop(s3_uri, None)
+            _S3_CACHE[s3_uri] = (etag, local_path)
+            stale_paths = [replaced[1]] if replaced else []
+        while len(_S3_CACHE) > S3_CACHE_SIZE:
+            stale_paths.append(_S3_CACHE.popitem(last=False)[1][1])
+    
+    for stale_path in stale_paths:
+        cleanup_temp_file(stale_path)
+    
+    return local_path
+
+
+@atexit.register
+def clear_s3_cache() -> None:
+    """Delete all cached S3 downloads."""
+    with _S3_CACHE_LOCK:
+        stale_paths = [local_path for _, local_path in _S3_CACHE.values()]
+        _S3_CACHE.clear()
+    
+    for stale_path in stale_paths:
+        cleanup_temp_file(stale_path)
+
+
+def get_local_path(excel_path: str, cache: bool = True) -> Tuple[str, bool]:
     """
     Get local file path, downloading from S3 if necessary.
     
     Args:
         excel_path: Local file path or S3 URI
+        cache: If True (default), S3 files are kept in a download cache
+            (up to S3_CACHE_SIZE entries) and reused until the object's
+            ETag changes; the cache owns those files. If False, every call
+            downloads a new temporary file that the caller must clean up.
     
     Returns:
-        Tuple of (local_file_path, is_temporary_file)
+        Tuple of (local_file_path, is_temporary_file). Cached S3 downloads
+        are not temporary files for the caller, so is_temporary_file is False.
+        A cached path is only valid until it is evicted, i.e. until
+        S3_CACHE_SIZE other distinct S3 URIs have been resolved through the
+        cache anywhere in the process, or until the object changes and is
+        downloaded again. Read the file straight away, or pass cache=False
+        to get a file the caller owns.
     
     Raises:
         FileNotFoundError: If local file doesn't exist or S3 file not found
     """
-    if is_s3_uri(excel_path):
+    # Same check as is_s3_uri, inlined: this runs on every sheet load
+    if excel_path.startswith('s3://'):
+        if cache:
+            return _cached_s3_download(excel_path), False
         local_path = download_from_s3(excel_path)
         return local_path, True
     
-    if not Path(excel_path).exists():
+    if not os.path.exists(excel_path):
         raise FileNotFoundError(f"Excel file not found: {excel_path}")
     return excel_path, False
 
 
+def get_local_paths(excel_paths: List[str], cache: bool = True,
+                    max_workers: int = 8) -> List[Tuple[str, bool]]:
+    """
+    Resolve many paths at once, checking local files and downloading S3
+    files concurrently.
+    
+    On network filesystems and S3 the per-path cost is latency, not CPU,
+    so overlapping the stat calls and downloads on a thread pool brings
+    the wall time for N paths down to roughly that of the slowest one.
+    
+    Args:
+        excel_paths: Local file paths and/or S3 URIs
+        cache: Passed to get_local_path for every path. Ignored when there
+            are more distinct S3 URIs than S3_CACHE_SIZE: the batch would
+            evict (and delete) its own earlier downloads, so each S3 file
+            is then downloaded to a temporary file the caller must clean up.
+        max_workers: Maximum number of paths resolved at once (default: 8)
+    
+    Returns:
+        List of (local_file_path, is_temporary_file), in the same order as
+        excel_paths
+    
+    Raises:
+        Same as get_local_path. If any path fails, temporary files already
+        downloaded for the others are deleted and the first error is raised.
+    
+    Example:
+        paths = get_local_paths(['data/a.xlsx', 's3://my-bucket/data/b.xlsx'])
+    """
+    if cache and len({path for path in excel_paths if is_s3_uri(path)}) > S3_CACHE_SIZE:
+        cache = False
+    
+    def resolve(excel_path: str):
+        try:
+            return get_local_path(excel_path, cache=cache)
+        except Exception as e:
+            return e
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(resolve, excel_paths))
+    
+    errors = [result for result in results if isinstance(result, Exception)]
+    if errors:
+        for result in results:
+            if not isinstance(result, Exception) and result[1]:
+                cleanup_temp_file(result[0])
+        raise errors[0]
+    
+    return results
+
+
+@contextmanager
+def local_excel(excel_path: str, cache: bool = True) -> Iterator[str]:
+    """
+    Context manager that yields a local path for excel_path and deletes
+    it afterwards if it is a temporary file, even if the block raises.
+    
+    Args:
+        excel_path: Local file path or S3 URI
+        cache: Passed to get_local_path
+    
+    Yields:
+        Path to a local file
+    
+    Raises:
+        FileNotFoundError: If local file doesn't exist or S3 file not found
+    
+    Example:
+        with local_excel('s3://my-bucket/data/file.xlsx') as path:
+            sheet_name, rows = load_sheet(path)
+    """
+    local_path, is_temp = get_local_path(excel_path, cache=cache)
+    try:
+        yield local_path
+    finally:
+        if is_temp:
+            cleanup_temp_file(local_path)
+
+
+def get_local_stream(excel_path: str, max_concurrency: int = 10) -> BinaryIO:
+    """
+    Open an Excel file as a binary stream, reading S3 objects into memory
+    instead of writing them to a temp file first.
+    
+    S3 objects up to S3_STREAM_MAX_MEMORY bytes never touch the disk;
+    larger ones spill to an anonymous temp file transparently. The stream
+    can be passed to load_sheet (or openpyxl/pandas) in place of a path.
+    
+    Args:
+        excel_path: Local file path or S3 URI
+        max_concurrency: Maximum number of S3 parts downloaded at once (default: 10)
+    
+    Returns:
+        Binary file object positioned at the start; the caller closes it
+    
+    Raises:
+        FileNotFoundError: If local file doesn't exist or S3 file not found
+    
+    Example:
+        with get_local_stream('s3://my-bucket/data/file.xlsx') as stream:
+            sheet_name, rows = load_sheet(stream)
+    """
+    if not excel_path.startswith('s3://'):  # Inlined is_s3_uri
+        if not os.path.exists(excel_path):
+            raise FileNotFoundError(f"Excel file not found: {excel_path}")
+        return open(excel_path, 'rb')
+    
+    _parse_s3_uri(excel_path)  # Reject invalid URIs before allocating a buffer
+    s3_client = _get_s3_client()
+    
+    stream = tempfile.SpooledTemporaryFile(max_size=S3_STREAM_MAX_MEMORY, suffix='.xlsx')
+    try:
+        _download_to_fileobj(s3_client, excel_path, stream, max_concurrency)
+    except Exception:
+        stream.close()
+        raise
+    
+    stream.seek(0)
+    return stream
+
+
+def default_engine() -> str:
+    """
+    Get the default Excel parsing engine.
+    
+    Returns:
+        'calamine' if python-calamine is installed, 'openpyxl' otherwise
+    """
+    return 'calamine' if CALAMINE_AVAILABLE else 'openpyxl'
+
+
+def _normalize_calamine_value(value: Any) -> Any:
+    """
+    Convert a calamine cell value to the value openpyxl would return.
+    
+    calamine reports empty cells as '', every number as float and date-only
+    cells as date, whereas openpyxl returns None for empty cells, int for
+    whole numbers and datetime for dates. Floats from 1e16 up stay floats,
+    as openpyxl reads their exponent form (e.g. 1E+20) as float too.
+    """
+    if value == '':
+        return None
+    if type(value) is float and value.is_integer() and abs(value) < _MAX_PLAIN_INT:
+        return int(value)
+    if type(value) is datetime.date:
+        return datetime.datetime.combine(value, datetime.time())
+    return value
+
+
+def load_sheet(local_path: Union[str, BinaryIO], sheet_name: Optional[str] = None,
+               engine: Optional[str] = None, nrows: Optional[int] = None,
+               col_range: Optional[Tuple[int, int]] = None
+               ) -> Tuple[str, List[List[Any]]]:
+    """
+    Load a worksheet into a list of rows of cell values.
+    
+    Args:
+        local_path: Path to a local Excel file, or a binary file object
+            such as the one returned by get_local_stream
+        sheet_name: Optional sheet name. If None, loads the first sheet.
+        engine: 'calamine' or 'openpyxl'. If None, uses default_engine().
+        nrows: Optional number of rows to load, starting from row 1
+        col_range: Optional (first, last) 0-based column indices to load.
+            If None, loads columns starting at column A.
+    
+    Returns:
+        Tuple of (sheet_name, rows), where rows[row_idx][col_idx] is the
+        value of the cell at row_idx (0-based) and col_idx (0-based, counted
+        from the first loaded column), and empty cells are None
+    
+    Raises:
+        ImportError: If engine is 'calamine' and python-calamine is not installed
+        ValueError: If sheet name not found or engine is unknown
+    """
+    engine = engine or default_engine()
+    first_col, last_col = col_range if col_range else (0, None)
+    
+    if engine == 'calamine':
+        if not CALAMINE_AVAILABLE:
+            raise ImportError(
+                "python-calamine is required for engine='calamine'. "
+                "Install it with: pip install python-calamine"
+            )
+        if isinstance(local_path, (str, os.PathLike)):
+            workbook = CalamineWorkbook.from_path(local_path)
+        else:
+            workbook = CalamineWorkbook.from_filelike(local_path)
+        try:
+            if sheet_name and sheet_name not in workbook.sheet_names:
+                raise ValueError(
+                    f"Sheet '{sheet_name}' not found. "
+                    f"Available sheets: {workbook.sheet_names}"
+                )
+            sheet_name = sheet_name or workbook.sheet_names[0]
+            if nrows is not None and nrows <= 0:
+                return sheet_name, []
+            
+            sheet = workbook.get_sheet_by_name(sheet_name)
+            stop = last_col + 1 if last_col is not None else None
+            return sheet_name, [
+                [_normalize_calamine_value(value) for value in row[first_col:stop]]
+                for row in sheet.to_python(skip_empty_area=False, nrows=nrows)
+            ]
+        finally:
+            workbook.close()
+    
+    if engine == 'openpyxl':
+        # Imported here: openpyxl is most of utils' import time, and the
+        # default calamine engine never needs it
+        from openpyxl import load_workbook
+        
+        # read_only streams the sheet XML instead of building the full
+        # cell/style graph; values are copied out before the workbook closes
+        workbook = load_workbook(local_path, data_only=True, read_only=True,
+                                 keep_links=False)
+        try:
+            if sheet_name and sheet_name not in workbook.sheetnames:
+                raise ValueError(
+                    f"Sheet '{sheet_name}' not found. "
+                    f"Available sheets: {workbook.sheetnames}"
+                )
+            sheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+            # The stored <dimension> tag can be missing or stale; don't let it
+            # truncate the rows read_only mode yields
+            sheet.reset_dimensions()
+            if nrows is not None and nrows <= 0:
+                return sheet.title, []
+            
+            max_col = None
+            if last_col is not None:
+                max_col = last_col + 1
+                if max_col <= first_col:
+                    return sheet.title, []
+            
+            rows = []
+            for row in sheet.iter_rows(max_row=nrows, min_col=first_col + 1,
+                                       max_col=max_col, values_only=True):
+                row = list(row)
+                if max_col is not None:
+                    # Read-only sheets pad every row up to max_col; drop the
+                    # padding so the width matches the data, as with calamine
+                    while row and row[-1] is None:
+                        row.pop()
+                rows.append(row)
+            return sheet.title, rows
+        finally:
+            workbook.close()
+    
+    raise ValueError(f"Unknown engine: {engine}. Expected 'calamine' or 'openpyxl'")
+
+
 def is_blank_or_na(value: Any) -> bool:
     """
     Check if a value is blank, null, or N/A.
@@ -126,9 +988,14 @@ def is_blank_or_na(value: Any) -> bool:
         return True
     
     if isinstance(value, str):
+        if not value:
+            return True
+        # Longer than any blank marker with nothing to strip: skip the
+        # strip()/upper() copies for the common non-blank case
+        if len(value) > 4 and not (value[0].isspace() or value[-1].isspace()):
+            return False
         value_upper = value.strip().upper()
-        blank_values = ['', 'N/A', 'NA', 'NULL', 'NONE', '#N/A', '#NA']
-        if value_upper in blank_values:
+        if value_upper in BLANK_VALUES:
             return True
     
     return False
@@ -141,9 +1008,9 @@ def cleanup_temp_file(file_path: str) -> None:
     Args:
         file_path: Path to the file to delete
     """
-    if os.path.exists(file_path):
-        try:
-            os.unlink(file_path)
-        except OSError:
-            pass
+    # Just try the unlink: one syscall, and no race between check and delete
+    try:
+        os.unlink(file_path)
+    except OSError:
+        pass
 